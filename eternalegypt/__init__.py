@@ -1 +1 @@
-from .eternalegypt import Modem, Error
+from .eternalegypt import Modem, Error, Supervisor, SyncClient, create_websession
@@ -2,13 +2,28 @@
 import logging
 import re
 import json
+import heapq
+import itertools
+import collections
+from bisect import bisect_left
+from fnmatch import fnmatchcase
 from functools import wraps
+from contextlib import asynccontextmanager
 from datetime import datetime
 import asyncio
+import threading
+import types
+import aiohttp
 from aiohttp.client_exceptions import ClientError
 import attr
 
 TIMEOUT = 3
+MAX_REQUESTS = 2
+KEEPALIVE_TIMEOUT = 15
+
+PRIORITY_CONTROL = 0
+PRIORITY_SMS = 1
+PRIORITY_POLL = 2
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,7 +44,11 @@ class SMS:
 
 @attr.s
 class Information:
-    """Various information from the modem."""
+    """Various information from the modem.
+
+    The items read from a modem are a read-only snapshot. Prefix and glob
+    queries index the keys once, and again only if items is replaced.
+    """
     serial_number = attr.ib(default=None)
     usage = attr.ib(default=None)
     upstream = attr.ib(default=None)
@@ -49,6 +68,166 @@ class Information:
     sms = attr.ib(factory=list)
     items = attr.ib(factory=dict)
 
+    def _range(self, start, end):
+        """Return the sorted item keys from start up to, not including, end."""
+        # The index is kept outside the attrs fields and rebuilt whenever
+        # items is replaced, but not when a mutable items is changed in place.
+        index = getattr(self, '_keys', None)
+        if index is None or index[0] is not self.items:
+            index = self._keys = (self.items, sorted(self.items))
+        keys = index[1]
+        return keys[bisect_left(keys, start):bisect_left(keys, end) if end else len(keys)]
+
+    def get_prefix(self, prefix):
+        """Return the items at or below a key, like 'wifi' or 'wwan.profilelist'."""
+        if not prefix:
+            return dict(self.items)
+        result = {key: self.items[key] for key in self._range(prefix + '.', prefix + '/')}
+        if prefix in self.items:
+            result[prefix] = self.items[prefix]
+        return result
+
+    def query(self, pattern):
+        """Return the items with keys matching a glob, like 'wwan.profilelist.*.apn'."""
+        literal = pattern
+        for index, char in enumerate(pattern):
+            if char in '*?[':
+                literal = pattern[:index]
+                break
+
+        end = literal[:-1] + chr(ord(literal[-1]) + 1) if literal else None
+        return {
+            key: self.items[key]
+            for key in self._range(literal, end)
+            if fnmatchcase(key, pattern)
+        }
+
+    def get_str(self, key, default=None):
+        """Return an item as a string."""
+        value = self.items.get(key)
+        return default if value is None else str(value)
+
+    def get_int(self, key, default=None):
+        """Return an item as an integer."""
+        try:
+            return int(self.items[key])
+        except (KeyError, TypeError, ValueError):
+            return default
+
+    def get_float(self, key, default=None):
+        """Return an item as a float."""
+        try:
+            return float(self.items[key])
+        except (KeyError, TypeError, ValueError):
+            return default
+
+    def get_bool(self, key, default=None):
+        """Return an item as a boolean."""
+        value = self.items.get(key)
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.lower() in ('true', 'false'):
+            return value.lower() == 'true'
+        return default
+
+
+SECRET_ITEMS = frozenset((
+    'webd.adminpassword', 'session.sectoken', 'wifi.guest.passphrase', 'wifi.passphrase'))
+
+
+@attr.s(frozen=True)
+class Plan:
+    """What differs when reading information from a particular model."""
+    date_format = attr.ib(default='%d/%m/%y %I:%M:%S %p')
+
+
+DEFAULT_PLAN = Plan()
+
+PLANS = {
+    'MR1100': Plan(date_format='%m/%d/%y %I:%M:%S %p'),
+}
+
+
+def plan_for(data):
+    """Find the plan for the model that returned data."""
+    return PLANS.get(data['general'].get('model'), DEFAULT_PLAN)
+
+
+@attr.s
+class Scheduler:
+    """Limit concurrent requests to a device, serving urgent ones first."""
+    limit = attr.ib(default=MAX_REQUESTS)
+
+    active = attr.ib(init=False, default=0)
+    waiters = attr.ib(init=False, factory=list)
+    counter = attr.ib(init=False, factory=itertools.count)
+
+    async def acquire(self, priority):
+        """Wait for a request slot, lowest priority value first."""
+        if self.active < self.limit and not self.waiters:
+            self.active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiters, (priority, next(self.counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        """Return a request slot and hand it to the next waiter."""
+        self.active -= 1
+        while self.waiters:
+            _, _, future = heapq.heappop(self.waiters)
+            if not future.done():
+                self.active += 1
+                future.set_result(None)
+                return
+
+
+def scheduled(priority):
+    """Decorator that runs an action in a request slot of the given priority."""
+    def decorator(function):
+        @wraps(function)
+        async def wrapper(self, *args, **kwargs):
+            """Wrap a function with a scheduler slot."""
+            await self.scheduler.acquire(priority)
+            try:
+                return await function(self, *args, **kwargs)
+            finally:
+                self.scheduler.release()
+
+        return wrapper
+
+    return decorator
+
+
+def create_websession(limit=0, limit_per_host=MAX_REQUESTS,
+                      keepalive_timeout=KEEPALIVE_TIMEOUT, use_dns_cache=False,
+                      **kwargs):
+    """Create a client session that can be shared by many modems.
+
+    Connections are kept alive and limited per modem. Cookies are kept by
+    each Modem, so the session has no cookie jar to grow with the fleet.
+    The DNS cache is off by default because modems are usually addressed
+    by IP; pass use_dns_cache=True for fleets addressed by hostname.
+    The connector and cookie_jar are managed here and cannot be passed.
+    """
+    for key in ('connector', 'cookie_jar'):
+        if key in kwargs:
+            raise TypeError(f"create_websession() does not accept {key}")
+
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        use_dns_cache=use_dns_cache)
+    return aiohttp.ClientSession(
+        connector=connector, cookie_jar=aiohttp.DummyCookieJar(), **kwargs)
+
 
 def autologin(function, timeout=TIMEOUT):
     """Decorator that will try to login and redo an action before failing."""
@@ -67,7 +246,7 @@ def autologin(function, timeout=TIMEOUT):
 
         try:
             async with asyncio.timeout(timeout):
-                await self.login()
+                await self._login()
                 return await function(self, *args, **kwargs)
         except (asyncio.TimeoutError, ClientError, Error) as ex:
             raise Error(f"Autologin failed ({ex}) for {str(function)}")
@@ -84,9 +263,18 @@ class LB2120:
 
     password = attr.ib(default=None)
     token = attr.ib(default=None)
+    max_requests = attr.ib(default=MAX_REQUESTS)
 
     listeners = attr.ib(init=False, factory=list)
     max_sms_id = attr.ib(init=False, default=None)
+    scheduler = attr.ib(init=False)
+    cookies = attr.ib(init=False, factory=dict)
+    plan = attr.ib(init=False, default=None)
+    queued_poll = attr.ib(init=False, default=None)
+
+    @scheduler.default
+    def _scheduler_default(self):
+        return Scheduler(self.max_requests)
 
     @property
     def _baseurl(self):
@@ -104,21 +292,29 @@ class LB2120:
         """Cleanup resources."""
         self.websession = None
         self.token = None
+        self.cookies = {}
 
+    @scheduled(PRIORITY_CONTROL)
     async def login(self, password=None):
         """Create a session with the modem."""
+        await self._login(password)
+
+    async def _login(self, password=None):
+        """Create a session with the modem, without waiting for a slot."""
         if password is None:
             password = self.password
         else:
             self.password = password
 
         self.token = None
-        self.websession.cookie_jar.clear(lambda cookie: cookie['domain'] == self.hostname)
+        self.cookies = {}
+        if len(self.websession.cookie_jar):
+            self.websession.cookie_jar.clear(lambda cookie: cookie['domain'] == self.hostname)
 
         try:
             async with asyncio.timeout(TIMEOUT):
                 url = self._url('model.json')
-                async with self.websession.get(url) as response:
+                async with self._get(url) as response:
                     try:
                         data = json.loads(await response.text())
                         self.token = data.get('session', {}).get('secToken')
@@ -135,12 +331,32 @@ class LB2120:
                     'session.password': password,
                     'token': self.token
                 }
-                async with self.websession.post(url, data=data) as response:
+                async with self._post(url, data) as response:
                     _LOGGER.debug("Got cookie with status %d", response.status)
 
         except (asyncio.TimeoutError, ClientError, Error) as ex:
             raise Error(f"Could not login ({ex})")
 
+    @asynccontextmanager
+    async def _get(self, url):
+        """GET from the device with its session cookies."""
+        async with self.websession.get(url, cookies=self.cookies) as response:
+            self._update_cookies(response)
+            yield response
+
+    @asynccontextmanager
+    async def _post(self, url, data):
+        """POST to the device with its session cookies."""
+        async with self.websession.post(url, data=data, cookies=self.cookies) as response:
+            self._update_cookies(response)
+            yield response
+
+    def _update_cookies(self, response):
+        """Remember cookies set by the device, including on redirects."""
+        for step in (*response.history, response):
+            self.cookies.update({key: morsel.value for key, morsel in step.cookies.items()})
+
+    @scheduled(PRIORITY_SMS)
     @autologin
     async def sms(self, phone, message):
         """Send a message."""
@@ -155,7 +371,7 @@ class LB2120:
             'action': 'send',
             'token': self.token
         }
-        async with self.websession.post(url, data=data) as response:
+        async with self._post(url, data) as response:
             _LOGGER.debug("Sent message with status %d", response.status)
 
     def _config_call(self, key, value):
@@ -167,26 +383,30 @@ class LB2120:
             'ok_redirect': '/success.json',
             'token': self.token
         }
-        return self.websession.post(url, data=data)
+        return self._post(url, data)
 
+    @scheduled(PRIORITY_CONTROL)
     @autologin
     async def disconnect_lte(self):
         """Do an LTE disconnect."""
         async with self._config_call('wwan.connect', 'Disconnect') as response:
             _LOGGER.debug("Disconnected LTE with status %d", response.status)
 
+    @scheduled(PRIORITY_CONTROL)
     @autologin
     async def connect_lte(self):
         """Do an LTE reconnect."""
         async with self._config_call('wwan.connect', 'DefaultProfile') as response:
             _LOGGER.debug("Connected to LTE with status %d", response.status)
 
+    @scheduled(PRIORITY_SMS)
     @autologin
     async def delete_sms(self, sms_id):
         """Delete a message."""
         async with self._config_call('sms.deleteId', sms_id) as response:
             _LOGGER.debug("Delete %d with status %d", sms_id, response.status)
 
+    @scheduled(PRIORITY_CONTROL)
     @autologin
     async def set_failover_mode(self, mode):
         """Set failover mode."""
@@ -203,6 +423,7 @@ class LB2120:
         async with self._config_call('failover.mode', modes[mode]) as response:
             _LOGGER.debug("Set mode to %s", mode)
 
+    @scheduled(PRIORITY_CONTROL)
     @autologin
     async def set_autoconnect_mode(self, mode):
         """Set autoconnect mode."""
@@ -219,18 +440,21 @@ class LB2120:
         async with self._config_call('wwan.autoconnect', modes[mode]) as response:
             _LOGGER.debug("Set mode to %s", mode)
 
+    @scheduled(PRIORITY_CONTROL)
     @autologin
     async def router_restart(self):
         """Do a device restart."""
         async with self._config_call('general.shutdown', 'restart') as response:
             _LOGGER.debug("Router restart %d", response.status)
 
+    @scheduled(PRIORITY_CONTROL)
     @autologin
     async def factory_reset(self):
         """Do a factory reset."""
         async with self._config_call('general.factoryReset', 1) as response:
             _LOGGER.debug("Factory reset %d", response.status)
 
+    @scheduled(PRIORITY_CONTROL)
     @autologin
     async def set_ip_pass_through_enabled(self, ipPassThroughEnabled=True):
         """Set ipPassThroughEnabled on Netgear LM1200 using /Forms/config."""
@@ -243,13 +467,14 @@ class LB2120:
             "general.shutdown": "Restart"
         }
         url = self._url("Forms/config")
-        async with self.websession.post(url, data=data) as response:
+        async with self._post(url, data) as response:
             text = await response.text()
             _LOGGER.debug("Set ipPassThroughEnabled %s returned status %d", ipPassThroughEnabled, response.status)
             _LOGGER.debug("Response body: %s", text)
             if response.status != 200 or "error" in text.lower():
                 raise Error("Could not set Bridge Mode")
 
+    @scheduled(PRIORITY_CONTROL)
     @autologin
     async def set_apn(self, apn, profile_index=1, profile_id=3, name="", authtype="None",
                     username="", pdp_type="IPV4V6", roaming_type="IPV4"):
@@ -269,7 +494,7 @@ class LB2120:
             "token": self.token
         }
         url = self._url("Forms/profile")
-        async with self.websession.post(url, data=data) as response:
+        async with self._post(url, data) as response:
             text = await response.text()
             _LOGGER.debug("Set APN %d", response.status)
             _LOGGER.debug("Response body: %s", text)
@@ -280,34 +505,37 @@ class LB2120:
         """Read the bits we need from returned data."""
         result = Information()
 
-        result.serial_number = data['general']['FSN']
-        result.usage = data['wwan']['dataUsage']['generic']['dataTransferred']
+        if self.plan is None:
+            self.plan = plan_for(data)
+        plan = self.plan
+
+        general = data['general']
+        wwan = data['wwan']
+        wwanadv = data['wwanadv']
+
+        result.serial_number = general['FSN']
+        result.usage = wwan['dataUsage']['generic']['dataTransferred']
         if 'failover' in data:
             result.upstream = data['failover'].get('backhaul')
             result.wire_connected = data['failover'].get('wanConnected')
-        result.mobile_connected = (data['wwan']['connection'] == 'Connected')
-        result.connection_text = data['wwan']['connectionText']
-        result.connection_type = data['wwan']['connectionType']
-        result.current_nw_service_type = data['wwan']['currentNWserviceType']
-        result.current_ps_service_type = data['wwan']['currentPSserviceType']
-        result.register_network_display = data['wwan']['registerNetworkDisplay']
-        result.roaming = data['wwan']['roaming']
-        result.radio_quality = data['wwanadv']['radioQuality']
-        result.rx_level = data['wwanadv']['rxLevel']
-        result.tx_level = data['wwanadv']['txLevel']
-        result.current_band = data['wwanadv']['curBand']
-        result.cell_id = data['wwanadv']['cellId']
-
-        mdy_models = ('MR1100')
+        result.mobile_connected = (wwan['connection'] == 'Connected')
+        result.connection_text = wwan['connectionText']
+        result.connection_type = wwan['connectionType']
+        result.current_nw_service_type = wwan['currentNWserviceType']
+        result.current_ps_service_type = wwan['currentPSserviceType']
+        result.register_network_display = wwan['registerNetworkDisplay']
+        result.roaming = wwan['roaming']
+        result.radio_quality = wwanadv['radioQuality']
+        result.rx_level = wwanadv['rxLevel']
+        result.tx_level = wwanadv['txLevel']
+        result.current_band = wwanadv['curBand']
+        result.cell_id = wwanadv['cellId']
 
         for msg in [m for m in data['sms']['msgs'] if 'text' in m]:
             # {'id': '6', 'rxTime': '11/03/18 08:18:11 PM', 'text': 'tak tik',
             #  'sender': '555-987-654', 'read': False}
             try:
-                if ('model' in data['general'] and data['general']['model'] in mdy_models):
-                    dt = datetime.strptime(msg['rxTime'], '%m/%d/%y %I:%M:%S %p')
-                else:
-                    dt = datetime.strptime(msg['rxTime'], '%d/%m/%y %I:%M:%S %p')
+                dt = datetime.strptime(msg['rxTime'], plan.date_format)
             except ValueError:
                 dt = None
 
@@ -315,19 +543,52 @@ class LB2120:
             result.sms.append(element)
         result.sms.sort(key=lambda sms: sms.id)
 
-        result.items = {
+        result.items = types.MappingProxyType({
             key: value
             for key, value in flatten(data).items()
-            if key not in ('webd.adminpassword', 'session.sectoken', 'wifi.guest.passphrase', 'wifi.passphrase')
-        }
+            if key not in SECRET_ITEMS
+        })
 
         return result
 
-    @autologin
     async def information(self):
-        """Return the current information."""
+        """Return the current information.
+
+        Callers whose polls were coalesced get the same instance, so treat
+        the result as read-only.
+        """
+        # A poll that is still waiting for a slot serves later callers too,
+        # so stale polls never pile up behind urgent requests.
+        poll = self.queued_poll
+        if poll is None:
+            poll = self.queued_poll = asyncio.ensure_future(self._poll())
+            poll.add_done_callback(self._poll_done)
+        return await asyncio.shield(poll)
+
+    def _poll_done(self, poll):
+        """Retrieve the outcome of a poll that all callers may have left."""
+        if self.queued_poll is poll:
+            self.queued_poll = None
+        if not poll.cancelled() and poll.exception() is not None:
+            _LOGGER.debug("Poll failed (%s)", poll.exception())
+
+    async def _poll(self):
+        """Read information once a polling slot is available."""
+        try:
+            await self.scheduler.acquire(PRIORITY_POLL)
+        finally:
+            self.queued_poll = None
+
+        try:
+            return await self._information()
+        finally:
+            self.scheduler.release()
+
+    @autologin
+    async def _information(self):
+        """Read information from the device."""
         url = self._url('model.json')
-        async with self.websession.get(url) as response:
+        async with self._get(url) as response:
             try:
                 text = await response.text()
             except TimeoutError as ex:
@@ -371,6 +632,250 @@ class LB2120:
 class Modem(LB2120):
     """Class for any modem."""
 
+
+def is_connected(information):
+    """Return whether a poll shows a working upstream link.
+
+    The connection_text of a poll is free text that varies by model, so it
+    is only logged and not used to decide.
+    """
+    if information is None:
+        return False
+    if information.mobile_connected:
+        return True
+    return bool(information.wire_connected) and str(information.upstream).lower() == 'wan'
+
+
+@attr.s
+class Supervisor:
+    """Watch the connection of a modem and restore it when it drops."""
+
+    modem = attr.ib()
+    interval = attr.ib(default=30)
+    degraded_interval = attr.ib(default=2)
+    failures = attr.ib(default=2)
+    recovery_timeout = attr.ib(default=30)
+    backoff = attr.ib(default=5)
+    max_backoff = attr.ib(default=300)
+    failover_mode = attr.ib(
+        default=None,
+        validator=attr.validators.optional(attr.validators.in_(('auto', 'wire', 'mobile'))))
+    history = attr.ib(default=100)
+
+    down_since = attr.ib(init=False, default=None)
+    failed_polls = attr.ib(init=False, default=0)
+    attempts = attr.ib(init=False, default=0)
+    recovery_times = attr.ib(init=False)
+
+    @recovery_times.default
+    def _recovery_times_default(self):
+        return collections.deque(maxlen=self.history)
+
+    async def run(self):
+        """Supervise the connection until cancelled."""
+        while True:
+            await asyncio.sleep(await self.check())
+
+    async def check(self):
+        """Poll once, act on a confirmed drop and return the next delay."""
+        if self.modem.websession is None:
+            raise Error("Cannot supervise a logged out modem")
+
+        information = await self._poll()
+        if is_connected(information):
+            if self.down_since is not None:
+                self._recovered()
+            return self.interval
+
+        if self.down_since is None:
+            self.down_since = asyncio.get_running_loop().time()
+            _LOGGER.debug("Connection degraded on %s: %s", self.modem.hostname,
+                          information and information.connection_text)
+
+        self.failed_polls += 1
+        if self.failed_polls < self.failures:
+            return self.degraded_interval
+
+        if await self._recover(information):
+            return self.interval
+
+        delay = min(self.backoff * 2 ** self.attempts, self.max_backoff)
+        self.attempts += 1
+        _LOGGER.debug("Recovery attempt %d failed, retrying in %ds", self.attempts, delay)
+        return delay
+
+    async def _poll(self):
+        """Read information, treating errors as a failed poll."""
+        try:
+            return await self.modem.information()
+        except Error as ex:
+            _LOGGER.debug("Supervisor poll failed (%s)", ex)
+            return None
+
+    async def _recover(self, information):
+        """Try to restore the connection and verify it by polling."""
+        try:
+            if self.failover_mode is not None and information is not None and information.wire_connected:
+                await self.modem.set_failover_mode(self.failover_mode)
+            else:
+                await self.modem.disconnect_lte()
+                await self.modem.connect_lte()
+        except Error as ex:
+            _LOGGER.debug("Recovery action failed (%s)", ex)
+            return False
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.recovery_timeout
+        while loop.time() < deadline:
+            await asyncio.sleep(self.degraded_interval)
+            if is_connected(await self._poll()):
+                self._recovered()
+                return True
+
+        return False
+
+    def _recovered(self):
+        """Record the time to recovery and reset the failure state."""
+        elapsed = asyncio.get_running_loop().time() - self.down_since
+        self.recovery_times.append(elapsed)
+        _LOGGER.debug("Connection on %s recovered after %.1fs", self.modem.hostname, elapsed)
+        self.down_since = None
+        self.failed_polls = 0
+        self.attempts = 0
+
+
+@attr.s
+class SyncClient:
+    """Blocking interface to modems, run by a background event loop thread."""
+
+    loop = attr.ib(init=False, factory=asyncio.new_event_loop)
+    thread = attr.ib(init=False, default=None)
+    websession = attr.ib(init=False, default=None)
+    modems = attr.ib(init=False, factory=dict)
+    logins = attr.ib(init=False, factory=dict)
+
+    def __attrs_post_init__(self):
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name="eternalegypt", daemon=True)
+        self.thread.start()
+        self.websession = self._run(self._create_websession())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _run(self, coro):
+        """Run a coroutine on the loop thread and wait for its result."""
+        if threading.current_thread() is self.thread:
+            coro.close()
+            raise Error("Blocking call from the event loop thread, e.g. in a listener")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def _create_websession(self):
+        """Create the shared session inside the loop."""
+        return create_websession()
+
+    async def _modem(self, hostname, password):
+        """Return a logged in modem, reusing an earlier login."""
+        modem = self.modems.get(hostname)
+        if modem is None or modem.password != password:
+            if modem is not None:
+                await modem.logout()
+            modem = Modem(hostname=hostname, websession=self.websession, password=password)
+            self.modems[hostname] = modem
+            self.logins[hostname] = asyncio.ensure_future(modem.login())
+        login = self.logins[hostname]
+
+        try:
+            await asyncio.shield(login)
+        except Error:
+            if self.logins.get(hostname) is login:
+                del self.modems[hostname]
+                del self.logins[hostname]
+            raise
+
+        return modem
+
+    async def _call(self, hostname, password, name, *args, **kwargs):
+        """Call a modem method by name."""
+        if name == 'logout':
+            self.logins.pop(hostname, None)
+            modem = self.modems.pop(hostname, None)
+            if modem is not None:
+                await modem.logout()
+            return None
+
+        modem = await self._modem(hostname, password)
+        return await getattr(modem, name)(*args, **kwargs)
+
+    async def _batch(self, targets, name, *args, **kwargs):
+        """Call a modem method on many modems concurrently."""
+        hostnames = [hostname for hostname, _ in targets]
+        if len(set(hostnames)) != len(hostnames):
+            raise Error("Duplicate hostname in batch targets")
+        results = await asyncio.gather(
+            *(self._call(hostname, password, name, *args, **kwargs)
+              for hostname, password in targets),
+            return_exceptions=True)
+        return dict(zip(hostnames, results))
+
+    def call(self, hostname, password, name, *args, **kwargs):
+        """Call a modem method, like 'information', and wait for the result."""
+        return self._run(self._call(hostname, password, name, *args, **kwargs))
+
+    def batch(self, targets, name, *args, **kwargs):
+        """Call a modem method on (hostname, password) targets concurrently.
+
+        Returns a dict from hostname to result, or to the raised exception.
+        Each hostname may only appear once.
+        """
+        return self._run(self._batch(list(targets), name, *args, **kwargs))
+
+    def modem(self, hostname, password):
+        """Return a blocking proxy for a single modem."""
+        return SyncModem(self, hostname, password)
+
+    async def _close(self):
+        """Log out all modems and close the session."""
+        for modem in self.modems.values():
+            await modem.logout()
+        self.modems.clear()
+        self.logins.clear()
+        await self.websession.close()
+
+    def close(self):
+        """Release the session and stop the loop thread."""
+        if self.loop.is_closed():
+            return
+
+        try:
+            self._run(self._close())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.close()
+
+
+@attr.s
+class SyncModem:
+    """Blocking proxy whose methods call the same-named Modem methods."""
+
+    client = attr.ib()
+    hostname = attr.ib()
+    password = attr.ib(repr=False)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def method(*args, **kwargs):
+            return self.client.call(self.hostname, self.password, name, *args, **kwargs)
+
+        return method
+
+
 def flatten(obj, path=""):
     """Flatten nested dicts into hierarchical keys."""
     result = {}
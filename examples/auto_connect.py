@@ -4,15 +4,13 @@
 
 import sys
 import asyncio
-import aiohttp
 import logging
 
 import eternalegypt
 
 async def set_autoconnect_mode(mode):
     """Example of setting the autoconnect mode."""
-    jar = aiohttp.CookieJar(unsafe=True)
-    websession = aiohttp.ClientSession(cookie_jar=jar)
+    websession = eternalegypt.create_websession()
 
     try:
         modem = eternalegypt.Modem(hostname=sys.argv[1], websession=websession)
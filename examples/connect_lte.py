@@ -4,15 +4,13 @@
 
 import sys
 import asyncio
-import aiohttp
 import logging
 
 import eternalegypt
 
 async def connect():
     """Example of doing an LTE reconnect.."""
-    jar = aiohttp.CookieJar(unsafe=True)
-    websession = aiohttp.ClientSession(cookie_jar=jar)
+    websession = eternalegypt.create_websession()
 
     try:
         modem = eternalegypt.Modem(hostname=sys.argv[1], websession=websession)
@@ -4,15 +4,13 @@
 
 import sys
 import asyncio
-import aiohttp
 import logging
 
 import eternalegypt
 
 async def set_failover_mode(mode):
     """Example of printing the current upstream."""
-    jar = aiohttp.CookieJar(unsafe=True)
-    websession = aiohttp.ClientSession(cookie_jar=jar)
+    websession = eternalegypt.create_websession()
 
     try:
         modem = eternalegypt.Modem(hostname=sys.argv[1], websession=websession)
@@ -4,7 +4,6 @@
 
 import sys
 import asyncio
-import aiohttp
 import logging
 import pprint
 
@@ -15,8 +14,7 @@ logging.basicConfig(level=logging.DEBUG)
 
 async def get_information():
     """Example of printing the inbox."""
-    jar = aiohttp.CookieJar(unsafe=True)
-    websession = aiohttp.ClientSession(cookie_jar=jar)
+    websession = eternalegypt.create_websession()
 
     modem = eternalegypt.Modem(hostname=sys.argv[1], websession=websession)
     await modem.login(password=sys.argv[2])
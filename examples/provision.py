@@ -4,7 +4,6 @@
 
 import sys
 import asyncio
-import aiohttp
 
 import eternalegypt
 
@@ -13,8 +12,7 @@ import logging
 
 async def provision(op_mode="bridge"):
     """Example of provisioning to set APN, operation mode (default bridge) and output IMEI,ICCID for activation"""
-    jar = aiohttp.CookieJar(unsafe=True)
-    websession = aiohttp.ClientSession(cookie_jar=jar)
+    websession = eternalegypt.create_websession()
     imei = None
     iccid = None
     retval = 0
@@ -4,7 +4,6 @@
 
 import sys
 import asyncio
-import aiohttp
 
 import eternalegypt
 
@@ -13,8 +12,7 @@ logging.basicConfig(level=logging.DEBUG)
 
 async def reconnect():
     """Example of disconnecting and reconnecting."""
-    jar = aiohttp.CookieJar(unsafe=True)
-    websession = aiohttp.ClientSession(cookie_jar=jar)
+    websession = eternalegypt.create_websession()
 
     modem = eternalegypt.Modem(hostname=sys.argv[1], websession=websession)
     await modem.login(password=sys.argv[2])
@@ -4,7 +4,6 @@
 
 import sys
 import asyncio
-import aiohttp
 import logging
 
 import eternalegypt
@@ -14,8 +13,7 @@ logging.basicConfig(level=logging.DEBUG)
 
 async def send_message():
     """Example of sending a message."""
-    jar = aiohttp.CookieJar(unsafe=True)
-    websession = aiohttp.ClientSession(cookie_jar=jar)
+    websession = eternalegypt.create_websession()
 
     modem = eternalegypt.Modem(hostname=sys.argv[1], websession=websession)
     await modem.login(password=sys.argv[2])
@@ -4,14 +4,12 @@
 
 import sys
 import asyncio
-import aiohttp
 
 import eternalegypt
 
 
 async def wait_for_messages():
-    jar = aiohttp.CookieJar(unsafe=True)
-    websession = aiohttp.ClientSession(cookie_jar=jar)
+    websession = eternalegypt.create_websession()
 
     modem = eternalegypt.Modem(hostname=sys.argv[1], websession=websession)
     await modem.login(password=sys.argv[2])
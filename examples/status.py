@@ -4,14 +4,12 @@
 
 import sys
 import asyncio
-import aiohttp
 
 import eternalegypt
 
 async def get_information():
     """Example of printing the current upstream."""
-    jar = aiohttp.CookieJar(unsafe=True)
-    websession = aiohttp.ClientSession(cookie_jar=jar)
+    websession = eternalegypt.create_websession()
 
     try:
         modem = eternalegypt.Modem(hostname=sys.argv[1], websession=websession)
@@ -36,8 +34,8 @@ async def get_information():
             print("current_band: {}".format(result.current_band))
             print("cell_id: {}".format(result.cell_id))
         else:
-            key = sys.argv[3]
-            print("{}: {}".format(key, result.items.get(key)))
+            for key, value in result.query(sys.argv[3]).items():
+                print("{}: {}".format(key, value))
 
         await modem.logout()
     except eternalegypt.Error:
@@ -46,6 +44,6 @@ async def get_information():
     await websession.close()
 
 if len(sys.argv) not in (3, 4):
-    print("{}: <netgear ip> <netgear password> [key]".format(sys.argv[0]))
+    print("{}: <netgear ip> <netgear password> [key pattern]".format(sys.argv[0]))
 else:
     asyncio.run(get_information())
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+"""Example file for eternalegypt library."""
+
+import sys
+import asyncio
+
+import eternalegypt
+
+import logging
+logging.basicConfig(level=logging.DEBUG)
+
+async def supervise():
+    """Example of keeping the LTE connection up."""
+    websession = eternalegypt.create_websession()
+
+    modem = eternalegypt.Modem(hostname=sys.argv[1], websession=websession)
+    await modem.login(password=sys.argv[2])
+
+    supervisor = eternalegypt.Supervisor(modem)
+    try:
+        await supervisor.run()
+    finally:
+        print("Recovery times: {}".format(supervisor.recovery_times))
+        await modem.logout()
+        await websession.close()
+
+if len(sys.argv) != 3:
+    print("{}: <netgear ip> <netgear password>".format(sys.argv[0]))
+else:
+    asyncio.run(supervise())
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+
+"""Example file for eternalegypt library."""
+
+import sys
+
+import eternalegypt
+
+def get_information():
+    """Example of printing the upstream of many modems without asyncio."""
+    password = sys.argv[1]
+    targets = [(hostname, password) for hostname in sys.argv[2:]]
+
+    with eternalegypt.SyncClient() as client:
+        results = client.batch(targets, 'information')
+        for hostname, result in results.items():
+            if isinstance(result, Exception):
+                print("{}: {}".format(hostname, result))
+            else:
+                print("{}: {}".format(hostname, result.upstream))
+
+if len(sys.argv) < 3:
+    print("{}: <netgear password> <netgear ip> [netgear ip ...]".format(sys.argv[0]))
+else:
+    get_information()